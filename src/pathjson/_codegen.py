@@ -0,0 +1,157 @@
+# Builtin
+from __future__ import annotations
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+# Own
+from ._nodes import (
+    ArrayNode,
+    LeafNode,
+    Nodal,
+    Node,
+    ObjectNode,
+)
+from .exceptions import NoneValuesAccessedException
+
+if TYPE_CHECKING:
+    # External
+    import pandas as pd
+
+
+RowType = Literal["auto", "dict", "series"]
+
+
+class JsonifierGenerator:
+    _model: Node
+    _lines: List[str]
+    _counter: int
+    _namespace: Dict[str, Any]
+    _column_indices: Optional[Dict[str, int]]
+    _row_type: RowType
+
+    _FILENAME: ClassVar[str] = "<pathjson>"
+    _FUNCTION_NAME: ClassVar[str] = "jsonify"
+    _ARGUMENT: ClassVar[str] = "row"
+    # Keyed by `(row_type, positional)`. A bound `dict.get` treats missing keys
+    # like `None` values at the cost of a plain subscript. `Series.iat` skips
+    # label resolution; by label, `Series.at` is no faster than subscripting.
+    _ACCESSORS: ClassVar[Dict[Tuple[RowType, bool], str]] = {
+        ("auto", False): "row[{key!r}]",
+        ("auto", True): "row[{key!r}]",
+        ("dict", False): "get({key!r})",
+        ("series", False): "row[{key!r}]",
+        ("series", True): "row.iat[{key!r}]",
+    }
+
+    def __init__(
+        self,
+        model: Node,
+        *,
+        column_indices: Optional[Dict[str, int]] = None,
+        row_type: RowType = "auto",
+    ) -> None:
+        self._model = model
+        self._lines = []
+        self._counter = 0
+        self._namespace = {}
+        self._column_indices = column_indices
+        self._row_type = row_type
+
+    def generate(self) -> Callable[..., Nodal]:
+        self._lines = [f"def {self._FUNCTION_NAME}({self._ARGUMENT}):"]
+        self._counter = 0
+        self._namespace = {
+            "NoneValuesAccessedException": NoneValuesAccessedException,
+        }
+        self._write_prologue()
+        name, present = self._visit(self._model)
+        error_message = self._model.get_none_values_message()
+        self._write(f"if not {present}:")
+        self._write(f"raise NoneValuesAccessedException({error_message!r})", indent=2)
+        self._write(f"return {name}")
+        exec(compile(self.source, self._FILENAME, "exec"), self._namespace)
+        return self._namespace[self._FUNCTION_NAME]
+
+    @property
+    def source(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+    def _visit(self, node: Node) -> Tuple[str, str]:
+        # Returns an expression for the node's value and an expression that is
+        # truthy iff the node intersects the row.
+        if isinstance(node, LeafNode):
+            return self._visit_leaf(node)
+        if isinstance(node, ObjectNode):
+            name = self._new_name("n")
+            self._write(f"{name} = {{}}")
+            for key, child in node.children.items():
+                child_value, child_present = self._visit(child)
+                self._write(f"if {child_present}:")
+                self._write(f"{name}[{key!r}] = {child_value}", indent=2)
+            return name, name
+        if isinstance(node, ArrayNode):
+            name = self._new_name("n")
+            self._write(f"{name} = []")
+            for child in node.ordered_children:
+                child_value, child_present = self._visit(child)
+                self._write(f"if {child_present}:")
+                self._write(f"{name}.append({child_value})", indent=2)
+            return name, name
+        raise TypeError(f"Unsupported node type `{type(node).__name__}`.")
+
+    def _write_prologue(self) -> None:
+        if self._row_type == "dict":
+            self._write("get = row.get")
+
+    def _visit_leaf(self, node: LeafNode) -> Tuple[str, str]:
+        name = self._new_name("v")
+        key: Union[str, int] = node.jsonpath
+        if self._column_indices is not None:
+            key = self._column_indices[node.jsonpath]
+        accessor = self._ACCESSORS[self._row_type, self._column_indices is not None]
+        self._write(f"{name} = {accessor.format(key=key)}")
+        return name, f"{name} is not None"
+
+    def _new_name(self, prefix: str) -> str:
+        name = f"{prefix}{self._counter}"
+        self._counter += 1
+        return name
+
+    def _write(self, line: str, indent: int = 1) -> None:
+        self._lines.append("    " * indent + line)
+
+
+class BulkJsonifierGenerator(JsonifierGenerator):
+    _df: pd.DataFrame
+    _column_indices: Dict[str, int]
+
+    _ARGUMENT: ClassVar[str] = "i"
+
+    def __init__(
+        self, model: Node, df: pd.DataFrame, column_indices: Dict[str, int]
+    ) -> None:
+        super().__init__(model, column_indices=column_indices)
+        self._df = df
+
+    def _write_prologue(self) -> None:
+        # A contiguous (rows, leaves) bool bitmap and object matrix stay alive in
+        # the closure. Only the current row is turned into lists, since indexing
+        # an ndarray element boxes a NumPy scalar on every access.
+        self._namespace["presence_matrix"] = self._df.notna().to_numpy()
+        self._namespace["value_matrix"] = self._df.to_numpy(dtype=object)
+        self._write("present = presence_matrix[i].tolist()")
+        self._write("values = value_matrix[i].tolist()")
+
+    def _visit_leaf(self, node: LeafNode) -> Tuple[str, str]:
+        index = self._column_indices[node.jsonpath]
+        return f"values[{index!r}]", f"present[{index!r}]"
@@ -1,25 +1,32 @@
 # Builtin
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from functools import wraps
+import sys
+from types import MappingProxyType
 from typing import (
-    Callable,
     cast,
     Dict,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Protocol,
-    TypeVar,
+    Sequence,
+    Tuple,
     Union,
 )
 
 # Own
-from .exceptions import BaseException
+from .exceptions import (
+    DuplicateNodeAdditionException,
+    MissingArrayIndexException,
+    NoneValuesAccessedException,
+)
 
 
 Scalar = Union[float, str, bool]
 Nodal = Union[Scalar, Dict[str, "Nodal"], List["Nodal"]]
-S = TypeVar("S", bound="Node")
+Values = Sequence[Optional[Scalar]]
 
 
 class CanGetItem(Protocol):
@@ -28,79 +35,70 @@ class CanGetItem(Protocol):
 
 
 class Node(ABC):
+    __slots__ = ("jsonpath",)
+
     jsonpath: str
-    _last_checked_row: Optional[CanGetItem]
-    _intersected_last_time: bool
 
-    class NoneValuesAccessedException(BaseException):
-        pass
+    NoneValuesAccessedException = NoneValuesAccessedException
 
     def __init__(self, jsonpath: str) -> None:
         self.jsonpath = jsonpath
-        self._last_checked_row = None
-        self._intersected_last_time = False
 
-    @abstractmethod
     def get_value(self, row: CanGetItem) -> Nodal:
+        present, value = self.emit(row)
+        if not present:
+            raise self.NoneValuesAccessedException(self.get_none_values_message())
+        return value
+
+    def intersects(self, row: CanGetItem) -> bool:
+        return self.emit(row)[0]
+
+    def finalize(self) -> None:
+        pass
+
+    def get_none_values_message(self) -> str:
+        return f"Value at JSONPath `{self.jsonpath}` is `None`."
+
+    @abstractmethod
+    def get_leaves(self) -> Iterator[LeafNode]:
         ...
 
     @abstractmethod
-    def intersects(self, row: CanGetItem) -> bool:
+    def emit(self, row: CanGetItem) -> Tuple[bool, Nodal]:
         ...
 
-    @staticmethod
-    def cached(
-        intersects: Callable[[S, CanGetItem], bool]
-    ) -> Callable[[S, CanGetItem], bool]:
-        @wraps(intersects)
-        def cached_intersects(self: S, row: CanGetItem) -> bool:
-            if self._last_checked_row is row:
-                return self._intersected_last_time
-            self._intersected_last_time = intersects(self, row)
-            self._last_checked_row = row
-            return self._intersected_last_time
-
-        return cached_intersects
-
-    @staticmethod
-    def protected(
-        get_value: Callable[[S, CanGetItem], Nodal]
-    ) -> Callable[[S, CanGetItem], Nodal]:
-        @wraps(get_value)
-        def protected_get_value(self: S, row: CanGetItem) -> Nodal:
-            if not self.intersects(row):
-                error_message = (
-                    f"Values at JSONPaths `{self.jsonpath}***` are all `None`."
-                    if hasattr(self, "children")
-                    else f"Value at JSONPath `{self.jsonpath}` is `None`."
-                )
-                raise self.NoneValuesAccessedException(error_message)
-            return get_value(self, row)
 
-        return protected_get_value
+class LeafNode(Node):
+    __slots__ = ()
 
+    def __init__(self, jsonpath: str) -> None:
+        super().__init__(sys.intern(jsonpath))
 
-class LeafNode(Node):
-    @Node.protected
-    def get_value(self, row: CanGetItem) -> Scalar:
-        return cast(Scalar, row[self.jsonpath])
+    def get_leaves(self) -> Iterator[LeafNode]:
+        yield self
 
-    @Node.cached
-    def intersects(self, row: CanGetItem) -> bool:
-        return row[self.jsonpath] is not None
+    def emit(self, row: CanGetItem) -> Tuple[bool, Scalar]:
+        value = row[self.jsonpath]
+        return value is not None, cast(Scalar, value)
 
 
 class InternalNode(Node):
-    children: Dict[str, Node]
+    __slots__ = ("children", "_items")
 
-    class DuplicateNodeAdditionException(BaseException):
-        pass
+    children: Mapping[str, Node]
+    _items: Tuple[Tuple[str, Node], ...]
+
+    DuplicateNodeAdditionException = DuplicateNodeAdditionException
 
     def __init__(self, jsonpath: str) -> None:
         super().__init__(jsonpath)
         self.children = {}
+        self._items = ()
 
     def add_child(self, key: str, child: Node) -> None:
+        assert isinstance(
+            self.children, dict
+        ), f"Node `{self.jsonpath}` was modified after finalize()."
         if key in self.children:
             raise self.DuplicateNodeAdditionException(
                 f"""
@@ -110,35 +108,62 @@ class InternalNode(Node):
             )
         self.children[key] = child
 
-    @Node.cached
-    def intersects(self, row: CanGetItem) -> bool:
-        return any(map(lambda node: node.intersects(row), self.children.values()))
+    def finalize(self) -> None:
+        for node in self.children.values():
+            node.finalize()
+        self.children = MappingProxyType(dict(self.children))
+        self._items = tuple(self.children.items())
+
+    def get_leaves(self) -> Iterator[LeafNode]:
+        for node in self.children.values():
+            yield from node.get_leaves()
+
+    def get_none_values_message(self) -> str:
+        return f"Values at JSONPaths `{self.jsonpath}***` are all `None`."
 
 
 class ObjectNode(InternalNode):
-    @Node.protected
-    def get_value(self, row: CanGetItem) -> Dict[str, Nodal]:
-        return {
-            key: node.get_value(row)
-            for key, node in self.children.items()
-            if node.intersects(row)
-        }
+    __slots__ = ()
+
+    def emit(self, row: CanGetItem) -> Tuple[bool, Dict[str, Nodal]]:
+        dict_: Dict[str, Nodal] = {}
+        for key, node in self._items:
+            present, value = node.emit(row)
+            if present:
+                dict_[key] = value
+        return bool(dict_), dict_
 
 
 class ArrayNode(InternalNode):
-    class MissingArrayIndexException(BaseException):
-        pass
+    __slots__ = ("_ordered",)
 
-    @Node.protected
-    def get_value(self, row: CanGetItem) -> List[Nodal]:
-        length = len(self.children)
-        for n in range(0, length):
+    _ordered: Tuple[Node, ...]
+
+    MissingArrayIndexException = MissingArrayIndexException
+
+    def __init__(self, jsonpath: str) -> None:
+        super().__init__(jsonpath)
+        self._ordered = ()
+
+    @property
+    def ordered_children(self) -> Tuple[Node, ...]:
+        return self._ordered
+
+    def finalize(self) -> None:
+        super().finalize()
+        ordered: List[Node] = []
+        for n in range(0, len(self.children)):
             if str(n) not in self.children:
                 raise self.MissingArrayIndexException(
                     f"Missing a JSONPath of the format `{self.jsonpath}[{n}]***`."
                 )
+            ordered.append(self.children[str(n)])
+        self._ordered = tuple(ordered)
+
+    def emit(self, row: CanGetItem) -> Tuple[bool, List[Nodal]]:
         list_: List[Nodal] = []
-        for n in range(0, length):
-            if self.children[str(n)].intersects(row):
-                list_.append(self.children[str(n)].get_value(row))
-        return list_
+        for node in self._ordered:
+            present, value = node.emit(row)
+            if present:
+                list_.append(value)
+        return bool(list_), list_
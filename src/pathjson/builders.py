@@ -1,5 +1,6 @@
 # Builtin
 from __future__ import annotations
+from collections import Counter
 from collections.abc import Iterable
 import re
 from typing import (
@@ -7,12 +8,19 @@ from typing import (
     ClassVar,
     Dict,
     Generic,
-    List,
+    get_args,
+    Literal,
+    Mapping,
+    Optional,
+    overload,
     Pattern,
+    Tuple,
+    TYPE_CHECKING,
     TypeVar,
 )
 
 # Own
+from ._codegen import BulkJsonifierGenerator, JsonifierGenerator, RowType
 from .exceptions import BaseException
 from ._nodes import (
     ArrayNode,
@@ -22,14 +30,19 @@ from ._nodes import (
     Nodal,
     Node,
     ObjectNode,
+    Scalar,
+    Values,
 )
 
+if TYPE_CHECKING:
+    # External
+    import pandas as pd
+
 
 T = TypeVar("T", bound=CanGetItem)
 
 
 class JsonifyFunctionBuilder(Generic[T]):
-    _leaf_jsonpaths: List[str]
     _internal_nodes: Dict[str, InternalNode]
     _model: Node
 
@@ -40,69 +53,175 @@ class JsonifyFunctionBuilder(Generic[T]):
     class InvalidJSONPathException(BaseException):
         pass
 
+    class MissingColumnException(BaseException):
+        pass
+
+    class DuplicateColumnException(BaseException):
+        pass
+
+    class InvalidRowTypeException(BaseException):
+        pass
+
     def __init__(self, leaf_jsonpaths: Iterable[str]) -> None:
-        if isinstance(leaf_jsonpaths, list):
-            self._leaf_jsonpaths = leaf_jsonpaths
-        else:
-            self._leaf_jsonpaths = list(leaf_jsonpaths)
         self._internal_nodes = {}
-        self._model = self._get_model()
+        self._model = self._get_model(leaf_jsonpaths)
+        # Only needed while the model is being built.
+        self._internal_nodes.clear()
+
+    @overload
+    def build(
+        self,
+        *,
+        interpreted: bool = ...,
+        columns: None = ...,
+        row_type: RowType = ...,
+    ) -> Callable[[T], Nodal]:
+        ...
+
+    @overload
+    def build(
+        self,
+        *,
+        interpreted: bool = ...,
+        columns: Iterable[str],
+        row_type: Literal["auto"] = ...,
+    ) -> Callable[[Values], Nodal]:
+        ...
+
+    @overload
+    def build(
+        self,
+        *,
+        interpreted: bool = ...,
+        columns: Iterable[str],
+        row_type: Literal["series"],
+    ) -> Callable[[T], Nodal]:
+        ...
+
+    def build(
+        self,
+        *,
+        interpreted: bool = False,
+        columns: Optional[Iterable[str]] = None,
+        row_type: RowType = "auto",
+    ) -> Callable[..., Nodal]:
+        self._validate_row_type(row_type, columns)
+        column_indices: Optional[Dict[str, int]] = None
+        if columns is not None:
+            columns = list(columns)
+            column_indices = self._get_column_indices(columns)
+        if interpreted:
+            if row_type == "dict":
+                leaves = [leaf_node.jsonpath for leaf_node in self._model.get_leaves()]
+
+                def dict_jsonifier(row: Mapping[str, Optional[Scalar]]) -> Nodal:
+                    # Mirror the generated `row.get` lookups.
+                    return self._model.get_value(
+                        {leaf: row.get(leaf) for leaf in leaves}
+                    )
+
+                return dict_jsonifier
+            if columns is None or row_type == "series":
 
-    def build(self) -> Callable[[T], Nodal]:
-        def jsonifier(row: T) -> Nodal:
-            return self._model.get_value(row)
+                def jsonifier(row: T) -> Nodal:
+                    return self._model.get_value(row)
 
-        return jsonifier
+                return jsonifier
+            labels = columns
 
-    def _get_model(self) -> Node:
-        for leaf in self._leaf_jsonpaths:
-            leaf_node = LeafNode(leaf)
-            parent = self._get_parent_jsonpath(leaf)
-            self._join_nodes(parent, leaf_node)
-        return self._internal_nodes["$"]
+            def positional_jsonifier(row: Values) -> Nodal:
+                return self._model.get_value(dict(zip(labels, row)))
 
-    def _join_nodes(self, parent: str, child_node: Node) -> None:
-        if parent in self._internal_nodes:
-            key = self._get_child_key_in_parent(child_node.jsonpath)
-            parent_node = self._internal_nodes[parent]
+            return positional_jsonifier
+        return JsonifierGenerator(
+            self._model, column_indices=column_indices, row_type=row_type
+        ).generate()
+
+    def build_bulk(self, df: pd.DataFrame) -> Callable[[int], Nodal]:
+        self._check_columns(df.columns)
+        # Only the leaf columns are materialized, in model order.
+        leaves = [leaf_node.jsonpath for leaf_node in self._model.get_leaves()]
+        column_indices = {leaf: index for index, leaf in enumerate(leaves)}
+        return BulkJsonifierGenerator(
+            self._model, df[leaves], column_indices
+        ).generate()
+
+    def _get_model(self, leaf_jsonpaths: Iterable[str]) -> Node:
+        for leaf in leaf_jsonpaths:
+            self._validate_jsonpath(leaf)
+            self._join_nodes(LeafNode(leaf))
+        model = self._internal_nodes["$"]
+        model.finalize()
+        return model
+
+    def _join_nodes(self, leaf_node: LeafNode) -> None:
+        child_node: Node = leaf_node
+        while True:
+            parent, key = self._split(child_node.jsonpath)
+            parent_node = self._internal_nodes.get(parent)
+            if parent_node is not None:
+                parent_node.add_child(key, child_node)
+                return
+            parent_node = self._create_internal_node(parent, child_node.jsonpath)
             parent_node.add_child(key, child_node)
-            if isinstance(child_node, InternalNode):
-                self._internal_nodes[child_node.jsonpath] = child_node
-        elif parent == "$":
-            self._internal_nodes[parent] = self._create_internal_node(
-                parent, child_node.jsonpath
-            )
-            self._join_nodes(parent, child_node)
-        else:
-            new_child_node = self._create_internal_node(parent, child_node.jsonpath)
-            new_parent = self._get_parent_jsonpath(parent)
-            self._join_nodes(new_parent, new_child_node)
-            self._join_nodes(parent, child_node)
-
-    def _get_parent_jsonpath(self, child: str) -> str:
-        match = self._JSONPATH.match(child)
-        if match is None:
-            raise self.InvalidJSONPathException(
-                rf"""
-                JSONPath `{child}` is invalid. Allowed pattern is
-                `"^(\$\.[a-zA-Z]\w*|\[\d+\])*(\.[a-zA-Z]\w*|\[\d+\])$"`.
+            self._internal_nodes[parent] = parent_node
+            if parent == "$":
+                return
+            child_node = parent_node
+
+    def _get_column_indices(self, columns: Iterable[str]) -> Dict[str, int]:
+        columns = list(columns)
+        self._check_columns(columns)
+        return {column: index for index, column in enumerate(columns)}
+
+    def _check_columns(self, columns: Iterable[str]) -> None:
+        counts = Counter(columns)
+        for leaf_node in self._model.get_leaves():
+            if counts[leaf_node.jsonpath] == 0:
+                raise self.MissingColumnException(
+                    f"JSONPath `{leaf_node.jsonpath}` is not among the columns."
+                )
+            if counts[leaf_node.jsonpath] > 1:
+                raise self.DuplicateColumnException(
+                    f"""
+                    JSONPath `{leaf_node.jsonpath}` appears more than once among
+                    the columns.
+                    """
+                )
+
+    def _validate_row_type(
+        self, row_type: str, columns: Optional[Iterable[str]]
+    ) -> None:
+        if row_type not in get_args(RowType):
+            raise self.InvalidRowTypeException(
+                f"""
+                Row type `{row_type}` is invalid. Allowed values are
+                {", ".join(f"`{value}`" for value in get_args(RowType))}.
                 """
             )
-        return match.group("head")
+        if row_type == "dict" and columns is not None:
+            raise self.InvalidRowTypeException(
+                "Row type `dict` cannot be combined with `columns`."
+            )
 
-    def _get_child_key_in_parent(self, child: str) -> str:
-        match = self._JSONPATH.match(child)
-        if match is None:
+    def _validate_jsonpath(self, jsonpath: str) -> None:
+        if self._JSONPATH.fullmatch(jsonpath) is None:
             raise self.InvalidJSONPathException(
                 rf"""
-                JSONPath `{child}` is invalid. Allowed pattern is
+                JSONPath `{jsonpath}` is invalid. Allowed pattern is
                 `"^(\$\.[a-zA-Z]\w*|\[\d+\])*(\.[a-zA-Z]\w*|\[\d+\])$"`.
                 """
             )
-        tail = match.group("tail")
-        if tail.endswith("]"):
-            return tail[1:-1]
-        return tail[1:]
+
+    @staticmethod
+    def _split(jsonpath: str) -> Tuple[str, str]:
+        # Only called on validated JSONPaths and their ancestors, so the last
+        # `.` or `[` always starts the tail segment.
+        index = max(jsonpath.rfind("."), jsonpath.rfind("["))
+        head = jsonpath[:index]
+        if jsonpath.endswith("]"):
+            return head, jsonpath[index + 1 : -1]
+        return head, jsonpath[index + 1 :]
 
     def _create_internal_node(
         self, self_jsonpath: str, child_jsonpath: str
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Tuple
 
 # Own
 from pathjson import JsonifyFunctionBuilder
+from pathjson._nodes import ArrayNode, InternalNode, LeafNode, Node, ObjectNode
 
 
 @pytest.fixture
@@ -60,3 +61,149 @@ def test_jsonify_function_builder_functional(
     jsonify_function = JsonifyFunctionBuilder[pd.Series](df.columns).build()
     result = list(map(lambda t: jsonify_function(t[1]), df.iterrows()))
     assert result == expected_output
+
+
+def test_jsonify_function_builder_interpreted(
+    dataframe_and_output: Tuple[pd.DataFrame, List[Dict[str, Any]]]
+) -> None:
+    df, expected_output = dataframe_and_output
+    jsonify_function = JsonifyFunctionBuilder[pd.Series](df.columns).build(
+        interpreted=True
+    )
+    result = list(map(lambda t: jsonify_function(t[1]), df.iterrows()))
+    assert result == expected_output
+
+
+def test_jsonify_function_builder_bulk(
+    dataframe_and_output: Tuple[pd.DataFrame, List[Dict[str, Any]]]
+) -> None:
+    df, expected_output = dataframe_and_output
+    jsonify_function = JsonifyFunctionBuilder[pd.Series](df.columns).build_bulk(df)
+    result = list(map(jsonify_function, range(len(df))))
+    assert result == expected_output
+
+
+def test_jsonify_function_builder_bulk_nan() -> None:
+    df = pd.DataFrame({"$.B[0]": [1.0, np.nan], "$.A": [np.nan, 2.0], "$.C": [0, 1]})
+    jsonify_function = JsonifyFunctionBuilder[pd.Series](["$.A", "$.B[0]"]).build_bulk(
+        df
+    )
+    assert [jsonify_function(i) for i in range(len(df))] == [{"B": [1.0]}, {"A": 2.0}]
+
+
+@pytest.mark.parametrize("interpreted", [False, True])
+def test_jsonify_function_builder_positional(
+    dataframe_and_output: Tuple[pd.DataFrame, List[Dict[str, Any]]],
+    interpreted: bool,
+) -> None:
+    df, expected_output = dataframe_and_output
+    jsonify_function = JsonifyFunctionBuilder[pd.Series](df.columns).build(
+        interpreted=interpreted, columns=df.columns
+    )
+    result = list(map(jsonify_function, df.itertuples(index=False, name=None)))
+    assert result == expected_output
+
+
+@pytest.mark.parametrize("columns", [False, True])
+def test_jsonify_function_builder_series_row_type(
+    dataframe_and_output: Tuple[pd.DataFrame, List[Dict[str, Any]]], columns: bool
+) -> None:
+    df, expected_output = dataframe_and_output
+    jsonify_function = JsonifyFunctionBuilder[pd.Series](df.columns).build(
+        columns=df.columns if columns else None, row_type="series"
+    )
+    result = list(map(lambda t: jsonify_function(t[1]), df.iterrows()))
+    assert result == expected_output
+
+
+@pytest.mark.parametrize("interpreted", [False, True])
+def test_jsonify_function_builder_dict_row_type(interpreted: bool) -> None:
+    jsonify_function = JsonifyFunctionBuilder[Dict[str, Any]](
+        ["$.A", "$.B[0]", "$.B[1]"]
+    ).build(row_type="dict", interpreted=interpreted)
+    assert jsonify_function({"$.A": 1, "$.B[1]": 2}) == {"A": 1, "B": [2]}
+
+
+@pytest.mark.parametrize("row_type, columns", [("bogus", None), ("dict", ["$.A"])])
+@pytest.mark.parametrize("interpreted", [False, True])
+def test_jsonify_function_builder_invalid_row_type(
+    row_type: Any, columns: Any, interpreted: bool
+) -> None:
+    builder = JsonifyFunctionBuilder[Dict[str, Any]](["$.A"])
+    with pytest.raises(JsonifyFunctionBuilder.InvalidRowTypeException):
+        builder.build(row_type=row_type, columns=columns, interpreted=interpreted)
+
+
+def test_jsonify_function_builder_positional_column_orders() -> None:
+    builder = JsonifyFunctionBuilder[Dict[str, Any]](["$.A", "$.B"])
+    forward = builder.build(columns=["$.A", "$.B"])
+    backward = builder.build(columns=["$.B", "$.A"])
+    assert forward((1, 2)) == {"A": 1, "B": 2}
+    assert backward((1, 2)) == {"A": 2, "B": 1}
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_jsonify_function_builder_duplicate_column(bulk: bool) -> None:
+    df = pd.DataFrame([[1, 2, 3]], columns=["$.B", "$.A", "$.A"])
+    builder = JsonifyFunctionBuilder[pd.Series](["$.A", "$.B"])
+    with pytest.raises(JsonifyFunctionBuilder.DuplicateColumnException):
+        if bulk:
+            builder.build_bulk(df)
+        else:
+            builder.build(columns=df.columns)
+
+
+def test_jsonify_function_builder_missing_column() -> None:
+    builder = JsonifyFunctionBuilder[Dict[str, Any]](["$.A", "$.B"])
+    with pytest.raises(JsonifyFunctionBuilder.MissingColumnException):
+        builder.build(columns=["$.A"])
+
+
+@pytest.mark.parametrize("interpreted", [False, True])
+def test_jsonify_function_builder_all_none(interpreted: bool) -> None:
+    jsonify_function = JsonifyFunctionBuilder[Dict[str, Any]](["$.A", "$.B[0]"]).build(
+        interpreted=interpreted
+    )
+    with pytest.raises(
+        Node.NoneValuesAccessedException, match=r"Values at JSONPaths `\$\*\*\*`"
+    ):
+        jsonify_function({"$.A": None, "$.B[0]": None})
+
+
+def test_jsonify_function_builder_duplicate_jsonpath() -> None:
+    with pytest.raises(InternalNode.DuplicateNodeAdditionException) as exc_info:
+        JsonifyFunctionBuilder[Dict[str, Any]](["$.A", "$.A"])
+    assert str(exc_info.value) == (
+        "Child node `$.A` was added to parent node `$` "
+        "more than once during model-building."
+    )
+
+
+def test_jsonify_function_builder_missing_array_index() -> None:
+    with pytest.raises(ArrayNode.MissingArrayIndexException):
+        JsonifyFunctionBuilder[Dict[str, Any]](["$.A[0]", "$.A[2]"])
+
+
+@pytest.mark.parametrize(
+    "jsonpath", ["A", "$", "$.A.", "$.1A", "$.A[x]", "$..A", "$.A\n"]
+)
+def test_jsonify_function_builder_invalid_jsonpath(jsonpath: str) -> None:
+    with pytest.raises(JsonifyFunctionBuilder.InvalidJSONPathException):
+        JsonifyFunctionBuilder[Dict[str, Any]]([jsonpath])
+
+
+def test_node_get_value_and_intersects() -> None:
+    leaf_a = LeafNode("$.A")
+    leaf_b0 = LeafNode("$.B[0]")
+    array_b = ArrayNode("$.B")
+    array_b.add_child("0", leaf_b0)
+    model = ObjectNode("$")
+    model.add_child("A", leaf_a)
+    model.add_child("B", array_b)
+    model.finalize()
+    row = {"$.A": None, "$.B[0]": 1}
+    assert model.get_value(row) == {"B": [1]}
+    assert model.intersects(row)
+    assert not leaf_a.intersects(row)
+    with pytest.raises(Node.NoneValuesAccessedException):
+        leaf_a.get_value(row)